@@ -1,10 +1,28 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import random
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for faster serialization"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)
 
 # Read API key from secrets.txt
@@ -15,6 +33,18 @@ except FileNotFoundError:
     TMDB_API_KEY = os.environ.get('TMDB_API_KEY')
 
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
+TMDB_AUTH_PARAMS = {'api_key': TMDB_API_KEY}
+
+# How long a discover page is reused before asking TMDB again
+DISCOVER_CACHE_SECONDS = 3600
+
+# Worker threads for movie detail requests, shared across pages and games
+DETAIL_WORKERS = 16
+DETAIL_EXECUTOR = ThreadPoolExecutor(max_workers=DETAIL_WORKERS)
+
+# Shared session so TMDB calls reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=20))
 
 # Genre mapping for TMDB
 GENRE_MAP = {
@@ -53,63 +83,102 @@ PROVIDER_MAP = {
     'crunchyroll': 283
 }
 
+# The genre and provider lists never change, so encode their responses once
+STATIC_CACHE_HEADERS = {'Cache-Control': 'public, max-age=86400'}
+GENRES_BODY = orjson.dumps({'genres': list(GENRE_MAP.keys())})
+PROVIDERS_BODY = orjson.dumps({'providers': list(PROVIDER_MAP.keys())})
+
+
+@lru_cache(maxsize=4096)
+def get_movie_detail(movie_id):
+    """Fetch the fields we display for a single movie (cached by movie id)"""
+    detail_url = f"{TMDB_BASE_URL}/movie/{movie_id}"
+    
+    detail_response = SESSION.get(detail_url, params=TMDB_AUTH_PARAMS)
+    # Raise instead of returning so failed lookups are not cached
+    detail_response.raise_for_status()
+    detail_data = detail_response.json()
+    
+    return {
+        'id': movie_id,
+        'title': detail_data.get('title'),
+        'tagline': (detail_data.get('tagline') or '').strip(),
+        'poster_path': detail_data.get('poster_path'),
+        'release_date': detail_data.get('release_date'),
+        'vote_average': detail_data.get('vote_average')
+    }
+
+
+def get_movie_detail_or_none(movie_id):
+    """Like get_movie_detail, but returns None if the request fails"""
+    try:
+        return get_movie_detail(movie_id)
+    except requests.RequestException:
+        return None
+
+
+@lru_cache(maxsize=512)
+def _discover_page(genre_id, provider_string, page, cache_window):
+    """Fetch the movie ids on one discover page.
+    
+    cache_window is only part of the cache key, so cached pages expire
+    every DISCOVER_CACHE_SECONDS.
+    """
+    url = f"{TMDB_BASE_URL}/discover/movie"
+    params = {
+        **TMDB_AUTH_PARAMS,
+        'with_genres': genre_id,
+        'with_watch_providers': provider_string,
+        'watch_region': 'US',
+        'sort_by': 'popularity.desc',
+        'page': page,
+        'vote_count.gte': 100  # Only movies with at least 100 votes
+    }
+    
+    response = SESSION.get(url, params=params)
+    # Raise instead of returning so failed pages are not cached
+    response.raise_for_status()
+    
+    return tuple(movie['id'] for movie in response.json().get('results', []))
+
 
 def fetch_movies_with_taglines(genre_id, provider_ids, count=50):
     """Fetch movies from TMDB with taglines"""
     movies_with_taglines = []
+    seen_ids = set()
     page = 1
     max_pages = 10  # Limit to avoid too many API calls
     
     # Build provider string
     provider_string = '|'.join(map(str, provider_ids))
     
+    cache_window = int(time.time() // DISCOVER_CACHE_SECONDS)
+    
     while len(movies_with_taglines) < count and page <= max_pages:
         # Discover movies with filters
-        url = f"{TMDB_BASE_URL}/discover/movie"
-        params = {
-            'api_key': TMDB_API_KEY,
-            'with_genres': genre_id,
-            'with_watch_providers': provider_string,
-            'watch_region': 'US',
-            'sort_by': 'popularity.desc',
-            'page': page,
-            'vote_count.gte': 100  # Only movies with at least 100 votes
-        }
-        
-        response = requests.get(url, params=params)
-        if response.status_code != 200:
+        try:
+            page_ids = _discover_page(genre_id, provider_string, page, cache_window)
+        except requests.RequestException:
             break
-            
-        data = response.json()
-        results = data.get('results', [])
         
-        if not results:
+        if not page_ids:
             break
         
-        # Fetch detailed info for each movie to get tagline
-        for movie in results:
+        # Skip movies already returned on an earlier page (popularity can
+        # shift while paging, so TMDB sometimes repeats results)
+        movie_ids = [movie_id for movie_id in page_ids if movie_id not in seen_ids]
+        seen_ids.update(movie_ids)
+        
+        # Fetch detailed info for the whole page concurrently to get taglines
+        details = list(DETAIL_EXECUTOR.map(get_movie_detail_or_none, movie_ids))
+        
+        for detail in details:
             if len(movies_with_taglines) >= count:
                 break
-                
-            movie_id = movie['id']
-            detail_url = f"{TMDB_BASE_URL}/movie/{movie_id}"
-            detail_params = {'api_key': TMDB_API_KEY}
             
-            detail_response = requests.get(detail_url, params=detail_params)
-            if detail_response.status_code == 200:
-                detail_data = detail_response.json()
-                tagline = detail_data.get('tagline', '').strip()
-                
-                # Only include movies with taglines
-                if tagline:
-                    movies_with_taglines.append({
-                        'id': movie_id,
-                        'title': detail_data.get('title'),
-                        'tagline': tagline,
-                        'poster_path': detail_data.get('poster_path'),
-                        'release_date': detail_data.get('release_date'),
-                        'vote_average': detail_data.get('vote_average')
-                    })
+            # Only include movies with taglines
+            if detail and detail['tagline']:
+                movies_with_taglines.append(dict(detail))
         
         page += 1
     
@@ -122,17 +191,13 @@ def home():
 @app.route('/api/genres', methods=['GET'])
 def get_genres():
     """Return available genres"""
-    return jsonify({
-        'genres': list(GENRE_MAP.keys())
-    })
+    return Response(GENRES_BODY, mimetype='application/json', headers=STATIC_CACHE_HEADERS)
 
 
 @app.route('/api/providers', methods=['GET'])
 def get_providers():
     """Return available streaming providers"""
-    return jsonify({
-        'providers': list(PROVIDER_MAP.keys())
-    })
+    return Response(PROVIDERS_BODY, mimetype='application/json', headers=STATIC_CACHE_HEADERS)
 
 
 @app.route('/api/start-game', methods=['POST'])
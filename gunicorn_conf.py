@@ -0,0 +1,16 @@
+import multiprocessing
+import os
+
+# Gunicorn settings for production (Render), run with:
+#   gunicorn -c gunicorn_conf.py app:app
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# start-game spends most of its time waiting on TMDB, so gevent workers let
+# one process serve many requests at once instead of blocking per request
+worker_class = 'gevent'
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_connections = 1000
+
+# Cold start-game calls can make many TMDB requests
+timeout = 120